@@ -0,0 +1,417 @@
+import argparse
+import contextlib
+import cProfile
+import importlib.util
+import io
+import os
+import pstats
+import random
+import string
+import sys
+import time
+import tracemalloc
+from colorama import Fore, Style
+from typing import Dict, Any, List, Callable, Optional, Tuple
+
+CLI_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "OSINTIndustries-CLI.py")
+
+DEFAULT_DEPTH = 150
+
+# Budgets keyed by (case, function): (seconds, peak traced bytes) at --scale 1
+# and the default --depth. Each is about 4x the worst of several baseline runs
+# (--seed 0 --repeat 5), floored at 2 ms / 64 KiB so timer noise on
+# sub-millisecond calls does not trip them.
+#
+# For cases in SCALED_CASES the budget is multiplied by --scale, which assumes
+# cost grows linearly with payload size; superlinear growth shows up as a
+# violation. deep_nesting ignores --scale and its budgets only hold at the
+# default depth, use --budget-scale when probing other depths.
+BUDGETS = {
+    ("platform_list", "extract_useful_data"): (0.010, 1152 * 1024),
+    ("platform_list", "format_platform_result"): (0.004, 1088 * 1024),
+    ("platform_list", "print_box"): (0.008, 128 * 1024),
+    ("person_dict", "extract_useful_data"): (0.002, 64 * 1024),
+    ("person_dict", "format_nested_dict"): (0.002, 128 * 1024),
+    ("person_dict", "print_box"): (0.002, 128 * 1024),
+    ("deep_nesting", "extract_useful_data"): (0.002, 640 * 1024),
+    ("deep_nesting", "format_nested_dict"): (0.006, 1152 * 1024),
+    ("deep_nesting", "print_box"): (0.002, 64 * 1024),
+    ("wide_lists", "extract_useful_data"): (0.340, 24 * 1024 * 1024),
+    ("wide_lists", "format_nested_dict"): (0.260, 24 * 1024 * 1024),
+    ("wide_lists", "print_box"): (0.002, 128 * 1024),
+    ("huge_strings", "extract_useful_data"): (0.002, 64 * 1024),
+    ("huge_strings", "format_nested_dict"): (0.002, 8 * 1024 * 1024),
+    ("huge_strings", "print_box"): (0.120, 22 * 1024 * 1024),
+    ("sparse", "extract_useful_data"): (0.140, 384 * 1024),
+    ("sparse", "format_nested_dict"): (0.090, 832 * 1024),
+    ("sparse", "print_box"): (0.004, 128 * 1024),
+}
+
+MODULES = [
+    "instagram", "twitter", "facebook", "github", "reddit", "spotify", "discord",
+    "linkedin", "pinterest", "tiktok", "snapchat", "skype", "google", "microsoft",
+    "apple", "amazon", "ebay", "paypal", "dropbox", "gravatar", "duolingo", "strava",
+]
+
+CATEGORIES = ["Social Media", "Messaging", "Shopping", "Finance", "Productivity", "Gaming"]
+
+def load_cli():
+    """Load the CLI script as a module (its filename is not importable directly)
+
+    Executing the script also runs its colorama init, so it is not repeated here.
+    """
+    spec = importlib.util.spec_from_file_location("osint_industries_cli", CLI_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def random_word(rng: random.Random, min_len: int = 3, max_len: int = 10) -> str:
+    """Return a random lowercase word"""
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(min_len, max_len)))
+
+def random_sentence(rng: random.Random, words: int) -> str:
+    """Return a sentence made of random words"""
+    return " ".join(random_word(rng) for _ in range(words))
+
+def make_platform_item(rng: random.Random, found: bool = True) -> Dict[str, Any]:
+    """Build one platform entry shaped like a v2 username/email response item"""
+    module = rng.choice(MODULES)
+    item = {
+        "module": module,
+        "status": "found" if found else "not_found",
+        "category": {"name": rng.choice(CATEGORIES), "description": random_sentence(rng, 8)},
+        "reliable_source": rng.random() < 0.5,
+        "query": f"{random_word(rng)}@example.com",
+        "spec_format": [],
+        "front_schemas": [],
+    }
+
+    if found:
+        username = random_word(rng)
+        item["spec_format"] = [{
+            "id": {"value": str(rng.randint(10 ** 8, 10 ** 12)), "type": "str", "proper_key": "ID"},
+            "username": {"value": username, "type": "str", "proper_key": "Username"},
+            "name": {"value": random_sentence(rng, 2).title(), "type": "str", "proper_key": "Name"},
+            "picture_url": {"value": f"https://cdn.example.com/{username}.jpg", "type": "str"},
+            "profile_url": {"value": f"https://{module}.com/{username}", "type": "str"},
+            "followers": {"value": rng.randint(0, 100000), "type": "int"},
+            "following": {"value": rng.randint(0, 5000), "type": "int"},
+            "verified": {"value": rng.random() < 0.1, "type": "bool"},
+            "private": {"value": rng.random() < 0.3, "type": "bool"},
+            "registered": {"value": True, "type": "bool"},
+            "created_at": {"value": f"20{rng.randint(10, 24)}-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}", "type": "datetime"},
+            "last_seen": None,
+            "bio": {"value": random_sentence(rng, 20), "type": "str"},
+            "platform_variables": [
+                {"key": random_word(rng), "value": random_word(rng), "proper_key": random_word(rng).title(), "type": "str"}
+                for _ in range(5)
+            ],
+        }]
+        item["front_schemas"] = [{
+            "image": f"https://cdn.example.com/{username}.jpg",
+            "body": {random_word(rng): random_word(rng) for _ in range(4)},
+            "tags": [{"tag": random_word(rng)} for _ in range(3)],
+        }]
+
+    return item
+
+def realistic_platform_list(rng: random.Random, platforms: int) -> List[Dict[str, Any]]:
+    """Username/email style response: a list of platform items"""
+    return [make_platform_item(rng, found=rng.random() < 0.3) for _ in range(platforms)]
+
+def realistic_person_dict(rng: random.Random, breaches: int) -> Dict[str, Any]:
+    """Person style response: a dict with profile fields and a breach list"""
+    return {
+        "name": random_sentence(rng, 2).title(),
+        "age": rng.randint(18, 90),
+        "location": {"city": random_word(rng).title(), "country": random_word(rng).title(), "zip": None},
+        "occupation": random_sentence(rng, 3),
+        "emails": [f"{random_word(rng)}@example.com" for _ in range(15)],
+        "phones": [],
+        "addresses": [
+            {"street": random_sentence(rng, 3), "city": random_word(rng).title(), "previous": rng.random() < 0.5}
+            for _ in range(8)
+        ],
+        "breaches": [
+            {
+                "name": random_word(rng).title(),
+                "date": f"20{rng.randint(10, 24)}-01-01",
+                "description": random_sentence(rng, 40),
+                "data_classes": [random_word(rng) for _ in range(8)],
+                "extra": {"verified": rng.random() < 0.5, "sensitive": False, "notes": ""},
+            }
+            for _ in range(breaches)
+        ],
+    }
+
+def deep_nesting(rng: random.Random, depth: int) -> Dict[str, Any]:
+    """Dict/list chain nested `depth` levels deep, each level carrying a few scalars"""
+    node = {"leaf": random_word(rng)}
+    for level in range(depth):
+        node = {
+            "level": level,
+            "label": random_word(rng),
+            "children": [node, {"sibling": random_word(rng)}],
+        }
+    return {"root": node}
+
+def wide_lists(rng: random.Random, width: int) -> Dict[str, Any]:
+    """Very wide scalar and dict lists side by side"""
+    return {
+        "usernames": [random_word(rng) for _ in range(width)],
+        "records": [
+            {"id": i, "value": random_word(rng), "empty": "", "missing": None, "tags": [random_word(rng)]}
+            for i in range(width)
+        ],
+        "matrix": [[rng.randint(0, 9) for _ in range(20)] for _ in range(width // 20)],
+    }
+
+def huge_strings(rng: random.Random, size: int) -> Dict[str, Any]:
+    """Oversized string values, both wrappable prose and a single unbroken token"""
+    return {
+        "bio": random_sentence(rng, size // 7),
+        "token": "".join(rng.choice(string.ascii_letters) for _ in range(size)),
+        "url": "https://example.com/" + "a" * size,
+    }
+
+def sparse_payload(rng: random.Random, width: int) -> Dict[str, Any]:
+    """Mostly-empty structure that extract_useful_data has to prune"""
+    empties = [None, "", [], {}]
+    return {
+        f"field_{i}": {
+            "a": rng.choice(empties),
+            "b": [rng.choice(empties) for _ in range(5)],
+            "c": {"d": rng.choice(empties), "e": [{"f": None}]},
+            "g": i if i % 10 == 0 else None,
+        }
+        for i in range(width)
+    }
+
+# Cases whose payload size is driven by --scale: name -> (builder, size at scale 1)
+SCALED_CASES = {
+    "platform_list": (realistic_platform_list, 150),
+    "person_dict": (realistic_person_dict, 50),
+    "wide_lists": (wide_lists, 20000),
+    "huge_strings": (huge_strings, 500000),
+    "sparse": (sparse_payload, 5000),
+}
+
+CASE_NAMES = ["platform_list", "person_dict", "deep_nesting", "wide_lists", "huge_strings", "sparse"]
+
+def build_case(name: str, seed: int = 0, scale: int = 1, depth: int = DEFAULT_DEPTH) -> Any:
+    """Build one named payload, deterministic for a given seed and independent of other cases"""
+    rng = random.Random(f"{seed}:{name}")
+    if name == "deep_nesting":
+        return deep_nesting(rng, depth)
+    builder, size = SCALED_CASES[name]
+    return builder(rng, size * scale)
+
+@contextlib.contextmanager
+def silenced():
+    """Send stdout to os.devnull for the duration of the block
+
+    Nothing is buffered, so print_box output does not add to its memory peak;
+    the cost of the writes themselves is still part of its time.
+    """
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+def run_silently(func: Callable[[], Any]) -> Any:
+    """Call func with stdout sent to os.devnull"""
+    with silenced():
+        return func()
+
+def measure_time(func: Callable[[], Any], repeat: int) -> Tuple[float, Any]:
+    """Best wall time over `repeat` runs, plus the result of the last run"""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = run_silently(func)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def measure_memory(func: Callable[[], Any], top: int) -> Tuple[int, int, List[str]]:
+    """Peak traced allocation for one run, plus the size and top sites of what it retains
+
+    The snapshot is taken while the return value is still referenced, so the
+    listed sites are the allocations making up the result (and anything the
+    call leaked). Temporaries freed before func returned count toward the peak
+    but are not listed; the gap between peak and retained size is that
+    transient share. print_box returns None, so its peak is all transient.
+
+    stdout is redirected before tracing starts so the devnull file object and
+    redirect_stdout setup are not counted against func.
+    """
+    with silenced():
+        tracemalloc.start()
+        try:
+            result = func()
+            _, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            del result
+        finally:
+            tracemalloc.stop()
+
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    ])
+    stats = snapshot.statistics("lineno")
+    retained = sum(stat.size for stat in stats)
+    sites = [str(stat) for stat in stats[:top]]
+    return peak, retained, sites
+
+def measure_profile(func: Callable[[], Any], top: int) -> str:
+    """cProfile breakdown for one run, sorted by cumulative time"""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        run_silently(func)
+    finally:
+        profiler.disable()
+
+    out = io.StringIO()
+    stats = pstats.Stats(profiler, stream=out)
+    stats.strip_dirs().sort_stats("cumulative").print_stats(top)
+    return out.getvalue()
+
+def format_bytes(size: int) -> str:
+    """Human readable byte count"""
+    for unit in ["B", "KiB", "MiB"]:
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+def measure_target(case_name: str, func_name: str, func: Callable[[], Any], budget_scale: float,
+                   repeat: int, profile: bool, top: int, violations: List[str]) -> Tuple[bool, Any]:
+    """Measure one formatter call against its budget
+
+    Returns (completed, result); completed is False if the call raised, in
+    which case the error is recorded as a violation and result is None.
+    """
+    time_budget, memory_budget = BUDGETS[(case_name, func_name)]
+    time_budget *= budget_scale
+    memory_budget *= budget_scale
+
+    try:
+        elapsed, result = measure_time(func, repeat)
+        peak, retained, sites = measure_memory(func, top)
+    except Exception as e:
+        violations.append(f"{case_name}/{func_name}: raised {type(e).__name__}: {e}")
+        print(f"  {Fore.RED}✗ {func_name.ljust(24)} {type(e).__name__}: {e}{Style.RESET_ALL}")
+        return False, None
+
+    over_time = elapsed > time_budget
+    over_memory = peak > memory_budget
+    if over_time:
+        violations.append(f"{case_name}/{func_name}: {elapsed:.3f}s exceeds {time_budget:.3f}s")
+    if over_memory:
+        violations.append(f"{case_name}/{func_name}: peak {format_bytes(peak)} exceeds {format_bytes(memory_budget)}")
+
+    ok = not (over_time or over_memory)
+    color = Fore.GREEN if ok else Fore.RED
+    icon = "✓" if ok else "✗"
+    print(f"  {color}{icon}{Style.RESET_ALL} {func_name.ljust(24)} "
+          f"{(f'{elapsed * 1000:.1f} ms').rjust(12)} / {time_budget * 1000:.1f} ms   "
+          f"{format_bytes(peak).rjust(12)} / {format_bytes(memory_budget)}")
+
+    if profile:
+        print(f"\n{Fore.MAGENTA}▸ cProfile: {func_name}{Style.RESET_ALL}")
+        print(measure_profile(func, top))
+        print(f"{Fore.MAGENTA}▸ tracemalloc: {func_name} "
+              f"(retained {format_bytes(retained)} of {format_bytes(peak)} peak){Style.RESET_ALL}")
+        for site in sites:
+            print(f"    {site}")
+        print()
+
+    return True, result
+
+def run_case(cli, case_name: str, payload: Any, budget_scale: float, repeat: int,
+             profile: bool, top: int, violations: List[str]) -> None:
+    """Measure the formatters on one payload
+
+    The calls are synthetic stress targets rather than a replay of
+    display_results: extract_useful_data and print_box run on list payloads
+    too, and print_box is fed the formatter output plus any raw top-level
+    strings so oversized lines reach it untruncated. print_box is skipped if
+    the formatter it depends on failed.
+    """
+    def measure(func_name, func):
+        return measure_target(case_name, func_name, func, budget_scale, repeat, profile, top, violations)
+
+    measure("extract_useful_data", lambda: cli.extract_useful_data(payload))
+
+    if isinstance(payload, dict):
+        completed, lines = measure("format_nested_dict", lambda: cli.format_nested_dict(payload))
+        if completed:
+            lines = lines + [value for value in payload.values() if isinstance(value, str)]
+    else:
+        items = [item for item in payload if isinstance(item, dict)]
+        completed, formatted = measure("format_platform_result",
+                                       lambda: [cli.format_platform_result(item) for item in items])
+        if completed:
+            lines = [line for item_lines in formatted for line in item_lines]
+
+    if not completed:
+        print(f"  {Fore.YELLOW}? {'print_box'.ljust(24)} skipped, formatter failed{Style.RESET_ALL}")
+        return
+
+    measure("print_box", lambda: cli.print_box("Profile", lines))
+
+def run_harness(case_names: List[str], seed: int = 0, scale: int = 1, depth: int = DEFAULT_DEPTH,
+                repeat: int = 3, budget_scale: float = 1.0, profile: bool = False, top: int = 10) -> List[str]:
+    """Build and measure each named case in turn and return the budget violations"""
+    cli = load_cli()
+    violations = []
+
+    for case_name in case_names:
+        print(f"\n{Fore.YELLOW}{'─' * 80}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}● {case_name}{Style.RESET_ALL}")
+        print(f"{Fore.YELLOW}{'─' * 80}{Style.RESET_ALL}")
+
+        payload = build_case(case_name, seed, scale, depth)
+        # Budgets are calibrated at scale 1; see BUDGETS for the linear assumption
+        case_scale = budget_scale * (scale if case_name in SCALED_CASES else 1)
+        run_case(cli, case_name, payload, case_scale, repeat, profile, top, violations)
+
+    return violations
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Profile the CLI result formatters against synthetic payloads")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for payload generation")
+    parser.add_argument("--scale", type=int, default=1, help="multiplier for payload widths and string sizes")
+    parser.add_argument("--depth", type=int, default=DEFAULT_DEPTH, help="nesting depth of the deep_nesting case")
+    parser.add_argument("--case", action="append", choices=CASE_NAMES, help="only run the named case (repeatable)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per function, best is kept")
+    parser.add_argument("--budget-scale", type=float, default=1.0, help="multiply every budget, e.g. on slow machines")
+    parser.add_argument("--profile", action="store_true", help="print cProfile and tracemalloc breakdowns")
+    parser.add_argument("--top", type=int, default=10, help="rows shown in each breakdown")
+    args = parser.parse_args(argv)
+
+    if args.scale < 1:
+        parser.error("--scale must be at least 1")
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    if args.budget_scale <= 0:
+        parser.error("--budget-scale must be greater than 0")
+    if args.top < 1:
+        parser.error("--top must be at least 1")
+
+    case_names = [name for name in CASE_NAMES if not args.case or name in args.case]
+    violations = run_harness(case_names, args.seed, args.scale, args.depth, args.repeat,
+                             args.budget_scale, args.profile, args.top)
+
+    print(f"\n{Fore.YELLOW}{'─' * 80}{Style.RESET_ALL}")
+    if violations:
+        print(f"{Fore.RED}✗ {len(violations)} budget violation(s):{Style.RESET_ALL}")
+        for violation in violations:
+            print(f"  • {violation}")
+        return 1
+
+    print(f"{Fore.GREEN}✓ All formatters within budget{Style.RESET_ALL}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())